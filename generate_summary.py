@@ -13,17 +13,157 @@ Example: rignore-0.2.0-cp312-cp312-macosx_11_0_arm64.whl
 
 import argparse
 import fnmatch
+import io
 import json
 import os
 import re
 import sys
-from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+from typing import NamedTuple
+
+# Human-readable versions (e.g., PyPy3.9, 3.12)
+_VER_PYPY = re.compile(r"PyPy(\d+)\.(\d+)")
+_VER_CP = re.compile(r"(\d+)\.(\d+)")
+
+# Architecture keywords found in platform tags, mapped to display names
+_ARCH_NAMES = {
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "aarch64": "aarch64",
+    "arm64": "aarch64",
+    "armv7l": "armv7",
+    "armv7": "armv7",
+    "ppc64le": "ppc64le",
+    "s390x": "s390x",
+    "riscv64": "riscv64",
+    "i686": "x86",
+    "i386": "x86",
+    "x86": "x86",
+}
+# Single-pass matcher for all keywords; longer keywords come first so that
+# e.g. x86_64 wins over x86 at the same position
+_ARCH_RE = re.compile("|".join(map(re.escape, _ARCH_NAMES)))
+
+# Subdirectory count from which scan_wheels walks the top level in threads
+_PARALLEL_WALK_MIN_SUBDIRS = 4
+
+# Wheel count from which scan_wheels parses in threads (free-threaded Python only)
+_PARALLEL_PARSE_MIN_WHEELS = 500
+_PARSE_CHUNK_SIZE = 64
+
+
+def _split_tag(tag: str, prefix: str) -> tuple[str, str, bool] | None:
+    """
+    Split a Python/ABI tag into (major, minor, free-threaded).
+
+    Example: _split_tag("cp314t", "cp") -> ("3", "14", True)
+    """
+    if not tag.startswith(prefix):
+        return None
 
+    start = end = len(prefix)
+    while end < len(tag) and tag[end].isdecimal():
+        end += 1
 
-@dataclass
-class WheelInfo:
+    # Need at least one digit for major and one for minor
+    if end - start < 2:
+        return None
+
+    return tag[start], tag[start + 1 : end], tag[end : end + 1] == "t"
+
+
+@cache
+def _python_version(python_tag: str, abi_tag: str) -> str:
+    """Extract human-readable Python version from python and ABI tags."""
+    cpython = _split_tag(python_tag, "cp")
+
+    # Free-threaded Python (e.g., cp314t in python_tag or abi_tag)
+    # Check python_tag first
+    if cpython and cpython[2]:
+        major, minor, _ = cpython
+        return f"{major}.{minor}t"
+
+    # Check abi_tag for free-threaded (e.g., cp314-cp314t)
+    if (abi := _split_tag(abi_tag, "cp")) and abi[2]:
+        major, minor, _ = abi
+        return f"{major}.{minor}t"
+
+    # CPython (e.g., cp312, cp38)
+    if cpython:
+        major, minor, _ = cpython
+        return f"{major}.{minor}"
+
+    # PyPy (e.g., pp39, pp310)
+    if pypy := _split_tag(python_tag, "pp"):
+        major, minor, _ = pypy
+        return f"PyPy{major}.{minor}"
+
+    return python_tag
+
+
+@cache
+def _platform_name(platform_tag: str) -> str:
+    """Extract human-readable platform name from platform tag."""
+    platform = platform_tag.lower()
+
+    # macOS (e.g., macosx_11_0_arm64, macosx_10_9_x86_64)
+    if platform.startswith("macosx"):
+        if "arm64" in platform or "aarch64" in platform:
+            return "macOS ARM64"
+        elif "x86_64" in platform or "intel" in platform:
+            return "macOS x86_64"
+        elif "universal2" in platform:
+            return "macOS Universal2"
+        return "macOS"
+
+    # Windows (e.g., win_amd64, win32, win_arm64)
+    if platform.startswith("win"):
+        if "amd64" in platform or "x64" in platform:
+            return "Windows x64"
+        elif "arm64" in platform or "aarch64" in platform:
+            return "Windows ARM64"
+        elif "32" in platform or "x86" in platform:
+            return "Windows x86"
+        return "Windows"
+
+    # Linux manylinux (e.g., manylinux_2_17_x86_64, manylinux2014_aarch64)
+    if "manylinux" in platform:
+        arch = _extract_arch(platform)
+        return f"Linux {arch}"
+
+    # Linux musllinux (e.g., musllinux_1_1_x86_64, musllinux_1_2_aarch64)
+    if "musllinux" in platform:
+        arch = _extract_arch(platform)
+        return f"musllinux {arch}"
+
+    # Generic Linux
+    if "linux" in platform:
+        arch = _extract_arch(platform)
+        return f"Linux {arch}"
+
+    return platform
+
+
+def _extract_arch(platform: str) -> str:
+    """Extract architecture from platform string."""
+    # Wheel platform tags end with the architecture (e.g., win_arm64,
+    # manylinux_2_17_x86_64), so try the trailing one or two tokens first
+    tokens = platform.rsplit("_", 2)
+    if arch := _ARCH_NAMES.get(tokens[-1]) or _ARCH_NAMES.get("_".join(tokens[-2:])):
+        return arch
+
+    # Fall back to scanning the whole string for a known keyword
+    if match := _ARCH_RE.search(platform):
+        return _ARCH_NAMES[match[0]]
+
+    return "unknown"
+
+
+class WheelInfo(NamedTuple):
     """Parsed wheel file information."""
 
     python_tag: str
@@ -33,90 +173,12 @@ class WheelInfo:
     @property
     def python_version(self) -> str:
         """Extract human-readable Python version from python tag."""
-        # Free-threaded Python (e.g., cp314t in python_tag or abi_tag)
-        # Check python_tag first
-        if match := re.match(r"cp(\d)(\d+)t", self.python_tag):
-            major, minor = match.groups()
-            return f"{major}.{minor}t"
-
-        # Check abi_tag for free-threaded (e.g., cp314-cp314t)
-        if match := re.match(r"cp(\d)(\d+)t", self.abi_tag):
-            major, minor = match.groups()
-            return f"{major}.{minor}t"
-
-        # CPython (e.g., cp312, cp38)
-        if match := re.match(r"cp(\d)(\d+)", self.python_tag):
-            major, minor = match.groups()
-            return f"{major}.{minor}"
-
-        # PyPy (e.g., pp39, pp310)
-        if match := re.match(r"pp(\d)(\d+)", self.python_tag):
-            major, minor = match.groups()
-            return f"PyPy{major}.{minor}"
-
-        return self.python_tag
+        return _python_version(self.python_tag, self.abi_tag)
 
     @property
     def platform_name(self) -> str:
         """Extract human-readable platform name from platform tag."""
-        platform = self.platform_tag.lower()
-
-        # macOS (e.g., macosx_11_0_arm64, macosx_10_9_x86_64)
-        if platform.startswith("macosx"):
-            if "arm64" in platform or "aarch64" in platform:
-                return "macOS ARM64"
-            elif "x86_64" in platform or "intel" in platform:
-                return "macOS x86_64"
-            elif "universal2" in platform:
-                return "macOS Universal2"
-            return "macOS"
-
-        # Windows (e.g., win_amd64, win32, win_arm64)
-        if platform.startswith("win"):
-            if "amd64" in platform or "x64" in platform:
-                return "Windows x64"
-            elif "arm64" in platform or "aarch64" in platform:
-                return "Windows ARM64"
-            elif "32" in platform or "x86" in platform:
-                return "Windows x86"
-            return "Windows"
-
-        # Linux manylinux (e.g., manylinux_2_17_x86_64, manylinux2014_aarch64)
-        if "manylinux" in platform:
-            arch = self._extract_arch(platform)
-            return f"Linux {arch}"
-
-        # Linux musllinux (e.g., musllinux_1_1_x86_64, musllinux_1_2_aarch64)
-        if "musllinux" in platform:
-            arch = self._extract_arch(platform)
-            return f"musllinux {arch}"
-
-        # Generic Linux
-        if "linux" in platform:
-            arch = self._extract_arch(platform)
-            return f"Linux {arch}"
-
-        return platform
-
-    def _extract_arch(self, platform: str) -> str:
-        """Extract architecture from platform string."""
-        # Common architecture patterns
-        if "x86_64" in platform or "amd64" in platform:
-            return "x86_64"
-        if "aarch64" in platform or "arm64" in platform:
-            return "aarch64"
-        if "armv7" in platform or "armv7l" in platform:
-            return "armv7"
-        if "ppc64le" in platform:
-            return "ppc64le"
-        if "s390x" in platform:
-            return "s390x"
-        if "riscv64" in platform:
-            return "riscv64"
-        if "i686" in platform or "x86" in platform or "i386" in platform:
-            return "x86"
-
-        return "unknown"
+        return _platform_name(self.platform_tag)
 
 
 def parse_wheel_filename(filename: str) -> WheelInfo | None:
@@ -131,142 +193,217 @@ def parse_wheel_filename(filename: str) -> WheelInfo | None:
     # Remove .whl extension
     name = filename[:-4]
 
-    # Split by '-' and get the last 3 parts (python-abi-platform)
-    parts = name.split("-")
+    # Split off only the last 4 parts from the right (version-python-abi-platform),
+    # the distribution and build parts are never used
+    parts = name.rsplit("-", 4)
     if len(parts) < 5:  # Need at least: name, version, python, abi, platform
         return None
 
-    # Last 3 parts are python, abi, platform
-    python_tag = parts[-3]
-    abi_tag = parts[-2]
-    platform_tag = parts[-1]
+    _, _, python_tag, abi_tag, platform_tag = parts
 
     return WheelInfo(python_tag=python_tag, abi_tag=abi_tag, platform_tag=platform_tag)
 
 
-def scan_wheels(wheels_path: Path) -> tuple[dict[str, set[str]], set[str], set[str]]:
+def _iter_wheel_names(wheels_path: str | os.PathLike[str]) -> Iterator[str]:
+    """Recursively yield the filenames of all wheels under wheels_path."""
+    # Walk with an explicit stack instead of recursion, keeping paths as plain strings
+    stack = [os.fspath(wheels_path)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".whl"):
+                        yield entry.name
+        except OSError:
+            # Skip unreadable directories, like Path.rglob does
+            continue
+
+
+def _collect_wheel_names(wheels_path: str | os.PathLike[str]) -> list[str]:
+    """Collect the filenames of all wheels under wheels_path."""
+    names = list[str]()
+    subdirs = list[str]()
+    try:
+        with os.scandir(wheels_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".whl"):
+                    names.append(entry.name)
+    except OSError:
+        return names
+
+    # Downloaded artifacts usually live in one subdirectory per build job,
+    # walk those concurrently so their directory reads overlap. Small trees and
+    # single-CPU runners are walked serially, a thread pool only adds overhead there
+    workers = min(len(subdirs), os.cpu_count() or 1)
+    if len(subdirs) >= _PARALLEL_WALK_MIN_SUBDIRS and workers >= 2:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for subdir_names in executor.map(lambda d: list(_iter_wheel_names(d)), subdirs):
+                names.extend(subdir_names)
+    else:
+        for subdir in subdirs:
+            names.extend(_iter_wheel_names(subdir))
+
+    return names
+
+
+def _parse_wheel_names(names: list[str]) -> set[WheelInfo]:
+    """
+    Parse a batch of wheel filenames.
+
+    Invalid names are dropped, and collecting into a set drops wheels sharing the
+    same tags (e.g., other distributions in the same build), which add nothing.
+    """
+    return set(filter(None, map(parse_wheel_filename, names)))
+
+
+def _gil_enabled() -> bool:
+    """Whether the running interpreter has the GIL enabled (always true before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or bool(is_gil_enabled())
+
+
+def scan_wheels(
+    wheels_path: str | os.PathLike[str],
+) -> tuple[dict[str, frozenset[str]], frozenset[str], frozenset[str]]:
     """
     Scan all wheel files and build a matrix of platform -> versions.
 
     Returns:
-        - matrix: Dict mapping platform to set of Python versions
-        - platforms: Set of all platforms found
-        - versions: Set of all Python versions found
+        - matrix: Dict mapping platform to frozenset of Python versions
+        - platforms: Frozenset of all platforms found
+        - versions: Frozenset of all Python versions found
     """
-    matrix = defaultdict[str, set[str]](set)
-    platforms = set[str]()
-    versions = set[str]()
-
-    for wheel_file in wheels_path.rglob("*.whl"):
-        filename = wheel_file.name
+    matrix = dict[str, set[str]]()
 
-        wheel_info = parse_wheel_filename(filename)
-        if not wheel_info:
-            continue
+    wheel_names = _collect_wheel_names(wheels_path)
 
-        platform = wheel_info.platform_name
-        version = wheel_info.python_version
+    # Parsing is pure Python, so spreading it over threads only pays off on
+    # free-threaded interpreters, and only for large wheel sets
+    if len(wheel_names) >= _PARALLEL_PARSE_MIN_WHEELS and not _gil_enabled():
+        chunks = [
+            wheel_names[i : i + _PARSE_CHUNK_SIZE]
+            for i in range(0, len(wheel_names), _PARSE_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor() as executor:
+            wheel_infos = set[WheelInfo]().union(*executor.map(_parse_wheel_names, chunks))
+    else:
+        wheel_infos = _parse_wheel_names(wheel_names)
+
+    for python_tag, abi_tag, platform_tag in wheel_infos:
+        # Interned so that different tags naming the same platform/version
+        # (e.g., manylinux2014_x86_64 and manylinux_2_17_x86_64) share one string
+        platform = sys.intern(_platform_name(platform_tag))
+        platform_versions = matrix.get(platform)
+        if platform_versions is None:
+            matrix[platform] = platform_versions = set[str]()
+        platform_versions.add(sys.intern(_python_version(python_tag, abi_tag)))
+
+    # Freeze the results, platforms and versions are derived once from the matrix
+    frozen_matrix = {platform: frozenset(found) for platform, found in matrix.items()}
+    platforms = frozenset(frozen_matrix)
+    versions = frozenset[str]().union(*frozen_matrix.values())
+
+    return frozen_matrix, platforms, versions
+
+
+# Sort order for platform OS names
+_OS_ORDER = {
+    "Linux": 0,
+    "musllinux": 1,
+    "Windows": 2,
+    "macOS": 3,
+}
+
+# Sort order for architectures
+_ARCH_ORDER = {
+    "x86_64": 0,
+    "x86": 1,
+    "ARM64": 2,
+    "aarch64": 3,
+    "armv7": 4,
+    "s390x": 5,
+    "ppc64le": 6,
+    "Universal2": 7,
+}
+
+
+def _platform_sort_key(platform: str) -> tuple[int, int, str]:
+    os_name, _, arch = platform.partition(" ")
+    return (_OS_ORDER.get(os_name, 99), _ARCH_ORDER.get(arch, 99), platform)
+
+
+def _version_sort_key(version: str) -> tuple[int, int, int, int]:
+    # Strip the PyPy prefix or free-threaded suffix, then split major.minor
+    if version.startswith("PyPy"):
+        base, kind, freethreaded = version[4:], 1, 0  # PyPy comes after CPython
+    elif version.endswith("t"):
+        base, kind, freethreaded = version[:-1], 0, 1  # FT comes after regular
+    else:
+        base, kind, freethreaded = version, 0, 0
 
-        platforms.add(platform)
-        versions.add(version)
-        matrix[platform].add(version)
+    major, dot, minor = base.partition(".")
+    if not (dot and major.isdecimal() and minor.isdecimal()):
+        return (99, 0, 0, 0)
 
-    return matrix, platforms, versions
+    return (kind, int(major), int(minor), freethreaded)
 
 
-def sort_platforms(platforms: set[str]) -> list[str]:
+def sort_platforms(platforms: Iterable[str]) -> list[str]:
     """Sort platforms in a logical order (OS, then architecture)."""
-    os_order = {
-        "Linux": 0,
-        "musllinux": 1,
-        "Windows": 2,
-        "macOS": 3,
-    }
-
-    # Define order for architectures
-    arch_order = {
-        "x86_64": 0,
-        "x86": 1,
-        "ARM64": 2,
-        "aarch64": 3,
-        "armv7": 4,
-        "s390x": 5,
-        "ppc64le": 6,
-        "Universal2": 7,
-    }
-
-    def platform_sort_key(platform: str) -> tuple[int, int, str]:
-        parts = platform.split(" ", 1)
-        os_name = parts[0]
-        arch = parts[1] if len(parts) > 1 else ""
-
-        return (os_order.get(os_name, 99), arch_order.get(arch, 99), platform)
-
-    return sorted(platforms, key=platform_sort_key)
-
-
-def sort_versions(versions: set[str]) -> list[str]:
-    """Sort Python versions in logical order."""
+    return sorted(platforms, key=_platform_sort_key)
 
-    def version_sort_key(version: str) -> tuple[int, int, int, int]:
-        # Handle PyPy versions
-        if version.startswith("PyPy"):
-            match = re.match(r"PyPy(\d+)\.(\d+)", version)
-            if match:
-                major, minor = match.groups()
-                return (1, int(major), int(minor), 0)  # PyPy comes after CPython
-
-        # Handle free-threaded versions (e.g., 3.14t)
-        if version.endswith("t"):
-            match = re.match(r"(\d+)\.(\d+)t", version)
-            if match:
-                major, minor = match.groups()
-                return (0, int(major), int(minor), 1)  # FT comes after regular
-
-        # Handle regular CPython versions
-        match = re.match(r"(\d+)\.(\d+)", version)
-        if match:
-            major, minor = match.groups()
-            return (0, int(major), int(minor), 0)
 
-        return (99, 0, 0, 0)
-
-    return sorted(versions, key=version_sort_key)
+def sort_versions(versions: Iterable[str]) -> list[str]:
+    """Sort Python versions in logical order."""
+    return sorted(versions, key=_version_sort_key)
 
 
-def generate_table(matrix: dict[str, set[str]], platforms: set[str], versions: set[str]) -> str:
+def generate_table(
+    matrix: Mapping[str, AbstractSet[str]], platforms: AbstractSet[str], versions: AbstractSet[str]
+) -> str:
     """Generate the markdown table."""
-    lines = list[str]()
+    # Write straight into one buffer, binding write locally for the cell loop
+    buffer = io.StringIO()
+    write = buffer.write
 
     # Header
-    lines.append("# Build Summary - All Platforms and Architectures")
-    lines.append("")
+    write("# Build Summary - All Platforms and Architectures\n\n")
 
     # Sort platforms and versions
     sorted_platforms = sort_platforms(platforms)
     sorted_versions = sort_versions(versions)
 
     # Table header
-    header = "| Platform | " + " | ".join(sorted_versions) + " |"
-    separator = "|----------|" + "|".join(["-----"] * len(sorted_versions)) + "|"
-
-    lines.append(header)
-    lines.append(separator)
+    write("| Platform | ")
+    write(" | ".join(sorted_versions))
+    write(" |\n|----------|")
+    write("|".join(["-----"] * len(sorted_versions)))
+    write("|")
 
     # Table rows
+    # Pack each platform's versions into a bitmask indexed by column
+    version_index = {version: i for i, version in enumerate(sorted_versions)}
+    columns = range(len(sorted_versions))
+
     for platform in sorted_platforms:
-        row = f"| **{platform}** |"
-        for version in sorted_versions:
-            if version in matrix[platform]:
-                row += " ✅ |"
-            else:
-                row += " - |"
-        lines.append(row)
+        mask = 0
+        for version in matrix.get(platform, ()):
+            if version in version_index:
+                mask |= 1 << version_index[version]
+
+        write(f"\n| **{platform}** |")
+        for i in columns:
+            write(" ✅ |" if mask >> i & 1 else " - |")
 
-    return "\n".join(lines)
+    return buffer.getvalue()
 
 
-def parse_version_requirement(requirement: str, available_versions: set[str]) -> list[str]:
+def parse_version_requirement(requirement: str, available_versions: AbstractSet[str]) -> list[str]:
     """
     Parse version requirement string into list of versions.
 
@@ -278,6 +415,43 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
     - PyPy ranges: "PyPy3.9-3.11" -> ["PyPy3.9", "PyPy3.10", "PyPy3.11"]
     - PyPy open-ended: "PyPy3.9+" -> ["PyPy3.9", "PyPy3.10", ...] (limited by available)
     """
+    # Only open-ended requirements depend on the available versions
+    if not requirement.rstrip().endswith("+"):
+        return _expand_version_requirement(requirement, {}, {})
+
+    cpython_max_minor, pypy_max_minor = _max_minor_versions(available_versions)
+    return _expand_version_requirement(requirement, cpython_max_minor, pypy_max_minor)
+
+
+def _max_minor_versions(versions: Iterable[str]) -> tuple[dict[int, int], dict[int, int]]:
+    """
+    Find the highest available minor version for each major version.
+
+    Returns:
+        Tuple of (cpython_max_minor, pypy_max_minor), each mapping major -> minor
+    """
+    cpython_max_minor = dict[int, int]()
+    pypy_max_minor = dict[int, int]()
+
+    for version in versions:
+        if match := _VER_PYPY.match(version):
+            max_minor = pypy_max_minor
+        elif match := _VER_CP.match(version):
+            max_minor = cpython_max_minor
+        else:
+            continue
+
+        major, minor = map(int, match.groups())
+        if minor > max_minor.get(major, -1):
+            max_minor[major] = minor
+
+    return cpython_max_minor, pypy_max_minor
+
+
+def _expand_version_requirement(
+    requirement: str, cpython_max_minor: dict[int, int], pypy_max_minor: dict[int, int]
+) -> list[str]:
+    """Expand a version requirement using precomputed highest available minor versions."""
     requirement = requirement.strip()
 
     # Handle PyPy versions
@@ -285,16 +459,11 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
         # Handle PyPy open-ended ranges (e.g., "PyPy3.9+")
         if requirement.endswith("+"):
             start = requirement[:-1].strip()
-            if match := re.match(r"PyPy(\d+)\.(\d+)", start):
+            if match := _VER_PYPY.match(start):
                 major, minor_start = map(int, match.groups())
 
                 # Find the highest available PyPy version
-                max_minor = minor_start
-                for ver in available_versions:
-                    if ver_match := re.match(r"PyPy(\d+)\.(\d+)", ver):
-                        ver_major, ver_minor = map(int, ver_match.groups())
-                        if ver_major == major and ver_minor > max_minor:
-                            max_minor = ver_minor
+                max_minor = max(minor_start, pypy_max_minor.get(major, minor_start))
 
                 # Generate PyPy versions from start to max available + 1
                 return [f"PyPy{major}.{minor}" for minor in range(int(minor_start), max_minor + 2)]
@@ -302,8 +471,8 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
         # Handle PyPy ranges (e.g., "PyPy3.9-3.11")
         if "-" in requirement and requirement.count("-") == 1 and requirement.index("-") > 4:
             start_part, end = requirement.split("-", 1)
-            start_match = re.match(r"PyPy(\d+)\.(\d+)", start_part.strip())
-            end_match = re.match(r"(\d+)\.(\d+)", end.strip())
+            start_match = _VER_PYPY.match(start_part.strip())
+            end_match = _VER_CP.match(end.strip())
             if start_match and end_match:
                 major, minor_start = map(int, start_match.groups())
                 _, minor_end = map(int, end_match.groups())
@@ -317,16 +486,11 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
     # Handle CPython open-ended ranges (e.g., "3.10+")
     if requirement.endswith("+"):
         start = requirement[:-1].strip()
-        if match := re.match(r"(\d+)\.(\d+)", start):
+        if match := _VER_CP.match(start):
             major, minor_start = map(int, match.groups())
 
             # Find the highest available version to determine upper bound
-            max_minor = minor_start
-            for ver in available_versions:
-                if ver_match := re.match(r"(\d+)\.(\d+)", ver):
-                    ver_major, ver_minor = map(int, ver_match.groups())
-                    if ver_major == major and ver_minor > max_minor:
-                        max_minor = ver_minor
+            max_minor = max(minor_start, cpython_max_minor.get(major, minor_start))
 
             # Generate versions from start to max available + 1 (to allow checking for next version)
             return [f"{major}.{minor}" for minor in range(int(minor_start), max_minor + 2)]
@@ -334,8 +498,8 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
     # Handle CPython ranges (e.g., "3.10-3.13")
     if "-" in requirement:
         start, end = requirement.split("-", 1)
-        start_match = re.match(r"(\d+)\.(\d+)", start.strip())
-        end_match = re.match(r"(\d+)\.(\d+)", end.strip())
+        start_match = _VER_CP.match(start.strip())
+        end_match = _VER_CP.match(end.strip())
         if start_match and end_match:
             major, minor_start = map(int, start_match.groups())
             _, minor_end = map(int, end_match.groups())
@@ -346,9 +510,9 @@ def parse_version_requirement(requirement: str, available_versions: set[str]) ->
 
 
 def validate_requirements(
-    matrix: dict[str, set[str]],
-    platforms: set[str],
-    versions: set[str],
+    matrix: Mapping[str, AbstractSet[str]],
+    platforms: AbstractSet[str],
+    versions: AbstractSet[str],
     require_platforms: str,
     require_python_versions: str,
     require_freethreaded: str,
@@ -374,29 +538,53 @@ def validate_requirements(
             errors.append(f"Invalid JSON in require-matrix: {require_matrix}")
             return False, errors
 
-        # Validate each platform requirement in the matrix
+        if not isinstance(matrix_requirements, list) or not all(
+            isinstance(req, dict)
+            and isinstance(req.get("platform", ""), str)
+            and isinstance(req.get("versions", ""), str)
+            for req in matrix_requirements
+        ):
+            errors.append(
+                "require-matrix must be a JSON list of objects with string "
+                f"'platform' and 'versions' values: {require_matrix}"
+            )
+            return False, errors
+
+        # Parse each requirement once, up front: platform pattern and expanded versions
+        cpython_max_minor, pypy_max_minor = _max_minor_versions(versions)
+        prepared_requirements = list[tuple[str, list[str]]]()
+        # The same version spec is often repeated across platforms, expand it only once
+        expanded_requirements = dict[str, list[str]]()
         for req in matrix_requirements:
             platform_pattern = req.get("platform", "")
-            required_versions_str = req.get("versions", "")
-
             if not platform_pattern:
                 continue
 
-            # Find matching platforms (supports wildcards)
-            matching_platforms = [p for p in platforms if fnmatch.fnmatch(p, platform_pattern)]
+            required_versions = list[str]()
+            for version_req in req.get("versions", "").split(","):
+                if not (version_req := version_req.strip()):
+                    continue
+
+                expanded = expanded_requirements.get(version_req)
+                if expanded is None:
+                    expanded = expanded_requirements[version_req] = _expand_version_requirement(
+                        version_req, cpython_max_minor, pypy_max_minor
+                    )
+                required_versions.extend(expanded)
+
+            prepared_requirements.append((platform_pattern, required_versions))
+
+        # Validate each platform requirement in the matrix
+        for platform_pattern, required_versions in prepared_requirements:
+            # Find matching platforms (supports wildcards), compiling the pattern once.
+            # Literal names go through fnmatch too, so case handling is the same on
+            # every OS (case-insensitive on Windows) for literals and wildcards
+            matching_platforms = fnmatch.filter(platforms, platform_pattern)
 
             if not matching_platforms:
                 errors.append(f"No platforms found matching pattern: {platform_pattern}")
                 continue
 
-            # Parse required versions for this platform
-            required_versions_raw = [
-                v.strip() for v in required_versions_str.split(",") if v.strip()
-            ]
-            required_versions = list[str]()
-            for version_req in required_versions_raw:
-                required_versions.extend(parse_version_requirement(version_req, versions))
-
             # Check each matching platform for the required versions
             for platform in matching_platforms:
                 platform_versions = matrix.get(platform, set())
@@ -419,9 +607,12 @@ def validate_requirements(
     # Validate required Python versions (globally across all platforms)
     if require_python_versions:
         required_versions_raw = [v.strip() for v in require_python_versions.split(",") if v.strip()]
+        cpython_max_minor, pypy_max_minor = _max_minor_versions(versions)
         required_versions = list[str]()
         for req in required_versions_raw:
-            required_versions.extend(parse_version_requirement(req, versions))
+            required_versions.extend(
+                _expand_version_requirement(req, cpython_max_minor, pypy_max_minor)
+            )
 
         # Only check versions that could exist (filter by what's reasonable)
         missing_versions = [
@@ -432,8 +623,6 @@ def validate_requirements(
 
     # Validate free-threaded requirements (globally)
     if require_freethreaded and require_freethreaded != "none":
-        [v for v in versions if v.endswith("t")]
-
         if require_freethreaded == "3.14":
             if "3.14t" not in versions:
                 errors.append("Missing required free-threaded Python 3.14t")
@@ -517,9 +706,8 @@ def main() -> None:
 
     # Add validation results to table if there are errors
     if errors:
-        table += "\n\n## ⚠️ Missing Required Wheels\n\n"
-        for error in errors:
-            table += f"- ❌ {error}\n"
+        error_lines = "".join(f"- ❌ {error}\n" for error in errors)
+        table = f"{table}\n\n## ⚠️ Missing Required Wheels\n\n{error_lines}"
 
     # Write to GitHub step summary
     if github_step_summary := os.environ.get("GITHUB_STEP_SUMMARY"):
@@ -1,5 +1,8 @@
 """Tests for generate_summary module."""
 
+import ntpath
+import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -21,7 +24,7 @@ register_format_alias(".md", ".txt")
 
 
 class TestWheelInfo:
-    """Test WheelInfo dataclass."""
+    """Test WheelInfo named tuple."""
 
     def test_python_version_cpython(self) -> None:
         wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="linux_x86_64")
@@ -40,6 +43,15 @@ class TestWheelInfo:
         wheel = WheelInfo(python_tag="pp39", abi_tag="pypy39_pp73", platform_tag="linux_x86_64")
         assert wheel.python_version == "PyPy3.9"
 
+    def test_python_version_compressed_tag_set(self) -> None:
+        """Test compressed tag sets (e.g., cp38.cp39) use the first tag."""
+        wheel = WheelInfo(python_tag="cp38.cp39", abi_tag="abi3", platform_tag="linux_x86_64")
+        assert wheel.python_version == "3.8"
+
+    def test_python_version_unknown_tag(self) -> None:
+        wheel = WheelInfo(python_tag="py3", abi_tag="none", platform_tag="any")
+        assert wheel.python_version == "py3"
+
     def test_platform_name_macos_arm64(self) -> None:
         wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="macosx_11_0_arm64")
         assert wheel.platform_name == "macOS ARM64"
@@ -64,6 +76,22 @@ class TestWheelInfo:
         wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="manylinux_2_17_x86_64")
         assert wheel.platform_name == "Linux x86_64"
 
+    def test_platform_name_linux_aarch64(self) -> None:
+        wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="manylinux2014_aarch64")
+        assert wheel.platform_name == "Linux aarch64"
+
+    def test_platform_name_linux_i686(self) -> None:
+        wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="manylinux_2_17_i686")
+        assert wheel.platform_name == "Linux x86"
+
+    def test_platform_name_linux_armv7l(self) -> None:
+        wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="manylinux_2_17_armv7l")
+        assert wheel.platform_name == "Linux armv7"
+
+    def test_platform_name_linux_unknown_arch(self) -> None:
+        wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="linux_mips")
+        assert wheel.platform_name == "Linux unknown"
+
     def test_platform_name_musllinux(self) -> None:
         wheel = WheelInfo(python_tag="cp312", abi_tag="cp312", platform_tag="musllinux_1_1_x86_64")
         assert wheel.platform_name == "musllinux x86_64"
@@ -91,6 +119,13 @@ class TestParseWheelFilename:
         assert result.python_tag == "pp39"
         assert result.python_version == "PyPy3.9"
 
+    def test_parse_build_tag_wheel(self) -> None:
+        result = parse_wheel_filename("my-package-1.0.0-1-cp312-cp312-win_amd64.whl")
+        assert result is not None
+        assert result.python_tag == "cp312"
+        assert result.abi_tag == "cp312"
+        assert result.platform_tag == "win_amd64"
+
     def test_parse_invalid_extension(self) -> None:
         result = parse_wheel_filename("notawheel.tar.gz")
         assert result is None
@@ -138,6 +173,56 @@ class TestScanWheels:
         assert "3.12" in matrix["Windows x64"]
         assert "3.14t" in matrix["macOS ARM64"]
 
+    def test_scan_wheels_nested(self, tmp_path: Path) -> None:
+        """Test wheels in nested directories (e.g., per-job artifacts) are found."""
+        nested = tmp_path / "wheels-linux" / "dist"
+        nested.mkdir(parents=True)
+        (nested / "pkg-1.0.0-cp312-cp312-manylinux_2_17_x86_64.whl").touch()
+        (tmp_path / "pkg-1.0.0-cp313-cp313-win_amd64.whl").touch()
+        (tmp_path / "pkg-1.0.0.tar.gz").touch()
+        (tmp_path / "invalid.whl").touch()
+
+        matrix, platforms, versions = scan_wheels(tmp_path)
+
+        assert platforms == {"Linux x86_64", "Windows x64"}
+        assert versions == {"3.12", "3.13"}
+        assert matrix["Linux x86_64"] == {"3.12"}
+
+    def test_scan_wheels_multiple_subdirectories(self, tmp_path: Path) -> None:
+        """Test wheels spread over several artifact directories are all found."""
+        for name, wheel in [
+            ("wheels-linux", "pkg-1.0.0-cp312-cp312-manylinux_2_17_x86_64.whl"),
+            ("wheels-windows", "pkg-1.0.0-cp312-cp312-win_amd64.whl"),
+            ("wheels-macos", "pkg-1.0.0-cp313-cp313-macosx_11_0_arm64.whl"),
+            ("wheels-musllinux", "pkg-1.0.0-cp313-cp313-musllinux_1_2_x86_64.whl"),
+        ]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / wheel).touch()
+
+        matrix, platforms, versions = scan_wheels(tmp_path)
+
+        assert platforms == {"Linux x86_64", "Windows x64", "macOS ARM64", "musllinux x86_64"}
+        assert versions == {"3.12", "3.13"}
+        assert matrix["macOS ARM64"] == {"3.13"}
+
+    def test_scan_wheels_parallel_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test large wheel sets parsed in threads give the same result as serial parsing."""
+        for i in range(600):
+            (tmp_path / f"pkg{i}-1.0.0-cp3{10 + i % 5}-cp3{10 + i % 5}-win_amd64.whl").touch()
+        (tmp_path / "invalid.whl").touch()
+
+        serial = scan_wheels(tmp_path)
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        parallel = scan_wheels(tmp_path)
+
+        assert parallel == serial
+        assert serial[2] == {"3.10", "3.11", "3.12", "3.13", "3.14"}
+
+    def test_scan_wheels_str_path(self, temp_wheels: Path) -> None:
+        assert scan_wheels(str(temp_wheels)) == scan_wheels(temp_wheels)
+
 
 class TestSortPlatforms:
     """Test sort_platforms function."""
@@ -173,6 +258,11 @@ class TestSortVersions:
         # Should be in order: 3.8, 3.10, 3.12, 3.14, 3.14t, PyPy3.9
         assert sorted_list == ["3.8", "3.10", "3.12", "3.14", "3.14t", "PyPy3.9"]
 
+    def test_sort_versions_unknown_last(self) -> None:
+        versions = {"py3", "3.12", "PyPy3.10", "3.12t"}
+
+        assert sort_versions(versions) == ["3.12", "3.12t", "PyPy3.10", "py3"]
+
 
 class TestGenerateTable:
     """Test generate_table function with inline-snapshot."""
@@ -220,6 +310,16 @@ class TestGenerateTable:
 
         assert result == external("uuid:2862b59e-e298-4351-9094-91218ff7c1f8.md")
 
+    def test_generate_table_platform_without_versions(self) -> None:
+        """Test platforms missing from the matrix render as all dashes."""
+        matrix = {"Linux x86_64": {"3.12"}}
+        platforms = {"Linux x86_64", "Windows x64"}
+        versions = {"3.12"}
+
+        result = generate_table(matrix, platforms, versions)
+
+        assert result.splitlines()[-1] == "| **Windows x64** | - |"
+
     def test_generate_empty_table(self) -> None:
         """Test generating a table with no builds."""
         matrix: dict[str, set[str]] = {}
@@ -436,3 +536,50 @@ class TestValidateRequirements:
         assert len(errors) == 1
         assert "Linux x86_64" in errors[0]
         assert "3.13" in errors[0]
+
+    def test_matrix_validation_invalid_schema(self) -> None:
+        matrix = {"Linux x86_64": {"3.12"}}
+        platforms = {"Linux x86_64"}
+        versions = {"3.12"}
+
+        for require_matrix in [
+            '{"platform": "Linux x86_64", "versions": "3.12"}',
+            '[{"platform": "macOS*", "versions": ["3.12"]}]',
+            '[{"platform": ["Linux x86_64"], "versions": "3.12"}]',
+        ]:
+            success, errors = validate_requirements(
+                matrix,
+                platforms,
+                versions,
+                require_platforms="",
+                require_python_versions="",
+                require_freethreaded="none",
+                require_matrix=require_matrix,
+            )
+
+            assert success is False
+            assert len(errors) == 1
+            assert "require-matrix must be a JSON list of objects" in errors[0]
+
+    def test_matrix_validation_case_insensitive_on_windows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test literal and wildcard patterns both follow fnmatch's Windows case rules."""
+        monkeypatch.setattr(os, "path", ntpath)
+        matrix = {"Linux x86_64": {"3.12"}}
+        platforms = {"Linux x86_64"}
+        versions = {"3.12"}
+
+        for pattern in ["linux x86_64", "linux*"]:
+            success, errors = validate_requirements(
+                matrix,
+                platforms,
+                versions,
+                require_platforms="",
+                require_python_versions="",
+                require_freethreaded="none",
+                require_matrix=f'[{{"platform": "{pattern}", "versions": "3.12"}}]',
+            )
+
+            assert success is True
+            assert errors == []